@@ -1,8 +1,12 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
-import pandas as pd
-from bs4 import BeautifulSoup
-from selenium.webdriver.chrome.webdriver import WebDriver
+if TYPE_CHECKING:
+    import pandas as pd
+    from bs4 import BeautifulSoup
+    from selenium.webdriver.chrome.webdriver import WebDriver
 
 
 class DriverManagerABC(ABC):
@@ -13,6 +13,10 @@ class Settings(BaseSettings):
     SLEEEP_BETWEEN_REQUESTS: int = 2
     MAX_NUM_PAGES_WITH_LINKS: int = 3
     OUTPUT_PATH: int = 3
+    PAGE_ARCHIVE_PATH: str = ''
+    PHOTO_STORE_PATH: str = ''
+    PHOTO_DOWNLOAD_WORKERS: int = 4
+    CRAWL_STATE_PATH: str = ''
 
     class Config:
         env_file = Path(BASE_DIR, 'settings', 'env')
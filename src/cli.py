@@ -0,0 +1,291 @@
+import argparse
+import json
+import math
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from loguru import logger
+
+from settings.config import settings
+
+if TYPE_CHECKING:
+    from src.scrappers.resume_record import ResumeRecord
+    from src.support_modules.page_archive import Entry
+    from src.support_modules.photo_store import PhotoDownloader
+
+BASE_URL = 'https://joblab.ru'
+# Upper bound on resume pages parsed and written as one chunk on archive reparse
+ARCHIVE_CHUNK_SIZE = 1000
+
+# Heavy dependencies (selenium, undetected_chromedriver, pandas, bs4) are imported
+# inside the commands that use them so that parse-only and replay jobs start fast.
+
+
+def _iter_html_files(paths: List[str]) -> Iterator[Path]:
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(path.rglob('*.html'))
+        else:
+            yield path
+
+
+def _iter_pages(paths: List[str], archive_dir: str = None) -> Iterator[Tuple[str, str]]:
+    for html_file in _iter_html_files(paths):
+        yield str(html_file), html_file.read_text(encoding='utf-8')
+    if archive_dir:
+        from src.support_modules.page_archive import PageArchive
+
+        archive = PageArchive(archive_dir, read_only=True)
+        try:
+            yield from archive.iter_pages(kind='resume')
+        finally:
+            archive.close()
+
+
+def _parse_pages(pages: Iterator[Tuple[str, str]]) -> Iterator[Optional['ResumeRecord']]:
+    """Yields a record per page, or None for pages that could not be parsed."""
+    from bs4 import BeautifulSoup
+    from src.scrappers.job_lab_parser import JobLabDataParser
+
+    for resume_link, html in pages:
+        try:
+            soup = BeautifulSoup(html, 'html.parser')
+            yield JobLabDataParser.parse_resume(soup, resume_link=resume_link)
+        except Exception as e:
+            # Block, captcha and error pages end up in the archive too
+            logger.warning(f'Failed to parse {resume_link}: {e}')
+            yield None
+
+
+def _split_parsed(results: Iterator[Optional['ResumeRecord']]) -> Tuple[List['ResumeRecord'], int]:
+    records, failed = [], 0
+    for record in results:
+        if record is None:
+            failed += 1
+        else:
+            records.append(record)
+    return records, failed
+
+
+def _parse_archive_chunk(
+    archive_dir: str, entries: List[Tuple[str, 'Entry']]
+) -> Tuple[List['ResumeRecord'], int]:
+    from src.support_modules.page_archive import SegmentReader
+
+    reader = SegmentReader(archive_dir)
+    try:
+        pages = ((url, reader.read(*entry)) for url, entry in entries)
+        return _split_parsed(_parse_pages(pages))
+    finally:
+        reader.close()
+
+
+def _iter_archive_chunks(archive_dir: str, workers: int) -> Iterator[Tuple[List['ResumeRecord'], int]]:
+    """Yields parsed records and the number of failed pages chunk by chunk, in archive order."""
+    from src.support_modules.page_archive import PageArchive
+
+    # Only the parent loads the index; workers get their entries and read segments directly
+    entries = PageArchive(archive_dir, read_only=True).entries(kind='resume')
+    # Several chunks per worker keep the pool busy when page sizes vary, the cap bounds
+    # how many records are held at once on large archives
+    chunk_size = min(max(1, math.ceil(len(entries) / (workers * 4))), ARCHIVE_CHUNK_SIZE)
+    chunks = (entries[i:i + chunk_size] for i in range(0, len(entries), chunk_size))
+    if workers <= 1:
+        for chunk in chunks:
+            yield _parse_archive_chunk(archive_dir, chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_parse_archive_chunk, repeat(archive_dir), chunks)
+
+
+def _photo_downloader(store_dir: str) -> 'PhotoDownloader':
+    from src.support_modules.photo_store import PhotoDownloader, PhotoStore
+    from src.support_modules.rate_limiter import RateLimiter
+
+    return PhotoDownloader(
+        store=PhotoStore(store_dir),
+        rate_limiter=RateLimiter(settings.SLEEEP_BETWEEN_REQUESTS),
+        base_url=BASE_URL,
+        workers=settings.PHOTO_DOWNLOAD_WORKERS,
+    )
+
+
+def _save_chunks(
+    chunks: Iterator[Tuple[List['ResumeRecord'], int]],
+    output: str,
+    photo_downloader: 'PhotoDownloader' = None,
+) -> Tuple[int, int]:
+    """
+    Writes records to a CSV or .jsonl file chunk by chunk, so only one chunk is held at a time.
+
+    Returns:
+        Tuple[int, int]: Numbers of saved records and of pages that failed to parse.
+    """
+    from src.scrappers.resume_record import ResumeRecord
+
+    saved, failed = 0, 0
+    with open(output, 'w', encoding='utf-8', newline='') as output_file:
+        for chunk_number, (records, chunk_failed) in enumerate(chunks):
+            if photo_downloader is not None:
+                photo_downloader.fill_hashes(records)
+            if output.endswith('.jsonl'):
+                for record in records:
+                    output_file.write(json.dumps(record.to_dict(), ensure_ascii=False) + '\n')
+            else:
+                data = ResumeRecord.to_dataframe(records)
+                # Continue the index of earlier chunks so it stays unique across the file
+                data.index += saved
+                data.to_csv(output_file, header=chunk_number == 0)
+            saved += len(records)
+            failed += chunk_failed
+    return saved, failed
+
+
+def crawl(args: argparse.Namespace) -> None:
+    from src.scrappers.job_lab_scraper import JobLabScraper
+    from src.support_modules.page_archive import PageArchive
+
+    photo_downloader = _photo_downloader(args.photos) if args.photos else None
+    try:
+        scraper = JobLabScraper(
+            archive=PageArchive(args.archive) if args.archive else None,
+            rate_limiter=photo_downloader.rate_limiter if photo_downloader else None,
+            photo_downloader=photo_downloader,
+        )
+        if args.queries:
+            from src.scrappers.crawl_scheduler import CrawlScheduler
+
+            scheduler = CrawlScheduler(
+                scraper=scraper,
+                queries=CrawlScheduler.load_queries(args.queries),
+                state_path=args.state,
+                output_path=args.output,
+            )
+            # Rows are written to a file of this run after every batch
+            logger.info(f'Resumes scraped: {scheduler.run()}')
+            return
+        data = scraper.scrape(path=args.path)
+    finally:
+        if photo_downloader:
+            photo_downloader.close()
+    logger.info(f'Data scraped: {data.shape}')
+    data.to_csv(args.output)
+    logger.info('Data saved')
+
+
+def parse(args: argparse.Namespace) -> None:
+    # The first chunk holds the HTML inputs, possibly none, so the CSV header is always written
+    chunks = chain(
+        [_split_parsed(_parse_pages(_iter_pages(args.inputs)))],
+        _iter_archive_chunks(args.archive, args.workers) if args.archive else [],
+    )
+    photo_downloader = _photo_downloader(args.photos) if args.photos else None
+    try:
+        saved, failed = _save_chunks(chunks, args.output, photo_downloader)
+    finally:
+        if photo_downloader:
+            photo_downloader.close()
+    logger.info(f'Pages parsed: {saved}, failed: {failed}')
+    logger.info('Data saved')
+
+
+def process(args: argparse.Namespace) -> None:
+    import pandas as pd
+    from src.scrappers.job_lab_v2 import JobLabDataProcessor
+
+    processor = JobLabDataProcessor()
+    data = processor.merge_data([pd.read_csv(path, index_col=0) for path in args.inputs])
+    data = processor.transform_data(processor.clean_data(data))
+    if args.normalize:
+        data = processor.normalize_data(data)
+    logger.info(f'Data processed: {data.shape}')
+    data.to_csv(args.output)
+    logger.info('Data saved')
+
+
+def bench(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    from bs4 import BeautifulSoup  # noqa: F401
+    from src.scrappers.job_lab_parser import JobLabDataParser  # noqa: F401
+    logger.info(f'Parser imports: {time.perf_counter() - started:.3f}s')
+
+    pages, failed = 0, 0
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        # Counted as they stream instead of through _split_parsed, so records are not kept alive
+        for record in _parse_pages(_iter_pages(args.inputs, args.archive)):
+            if record is None:
+                failed += 1
+            else:
+                pages += 1
+    elapsed = time.perf_counter() - started
+    logger.info(
+        f'Pages parsed: {pages}, failed: {failed} in {elapsed:.3f}s '
+        f'({(pages + failed) / elapsed if elapsed else 0:.1f} pages/s)'
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='parser_joblab', description='JobLab resume scraper')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    crawl_parser = subparsers.add_parser('crawl', help='Crawl resumes from joblab.ru')
+    crawl_parser.add_argument('--path', default='/resume', help='Listing path to crawl')
+    crawl_parser.add_argument('--queries', help='JSON file with listing paths to crawl in one run')
+    crawl_parser.add_argument(
+        '--state', default=settings.CRAWL_STATE_PATH, help='JSON file with last crawl times for --queries'
+    )
+    crawl_parser.add_argument('--output', default=str(settings.OUTPUT_PATH), help='Output CSV file')
+    crawl_parser.add_argument(
+        '--archive', default=settings.PAGE_ARCHIVE_PATH, help='Directory of the raw page archive'
+    )
+    crawl_parser.add_argument(
+        '--photos', default=settings.PHOTO_STORE_PATH, help='Directory of the photo store'
+    )
+    crawl_parser.set_defaults(handler=crawl)
+
+    parse_parser = subparsers.add_parser('parse', help='Parse saved resume HTML pages')
+    parse_parser.add_argument('inputs', nargs='*', help='HTML files or directories with them')
+    parse_parser.add_argument('--archive', help='Reparse resume pages from the raw page archive')
+    parse_parser.add_argument('--workers', type=int, default=1, help='Processes for archive reparse')
+    parse_parser.add_argument('--output', required=True, help='Output CSV or .jsonl file')
+    parse_parser.add_argument('--photos', help='Download photos into this photo store')
+    parse_parser.set_defaults(handler=parse)
+
+    process_parser = subparsers.add_parser('process', help='Clean and merge scraped CSV files')
+    process_parser.add_argument('inputs', nargs='+', help='CSV files produced by crawl or parse')
+    process_parser.add_argument('--output', required=True, help='Output CSV file')
+    process_parser.add_argument('--normalize', action='store_true', help='Lowercase text columns')
+    process_parser.set_defaults(handler=process)
+
+    bench_parser = subparsers.add_parser('bench', help='Measure parser throughput on saved pages')
+    bench_parser.add_argument('inputs', nargs='*', help='HTML files or directories with them')
+    bench_parser.add_argument('--archive', help='Also parse resume pages from the raw page archive')
+    bench_parser.add_argument('--repeat', type=int, default=1, help='Number of passes over inputs')
+    bench_parser.set_defaults(handler=bench)
+
+    return parser
+
+
+def main(argv: List[str] = None) -> None:
+    logger.remove()
+    logger.add(sink=sys.stderr, level=settings.LOGURU_LEVEL)
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command in ('parse', 'bench') and not args.inputs and not args.archive:
+        parser.error(f'{args.command} needs HTML inputs, --archive or both')
+    try:
+        args.handler(args)
+    except Exception as e:
+        logger.error(f'Failed during {args.command}: {e}')
+        raise
+
+
+if __name__ == '__main__':
+    main()
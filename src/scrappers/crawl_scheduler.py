@@ -0,0 +1,247 @@
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, TYPE_CHECKING
+
+from loguru import logger
+
+from settings.config import settings
+from src.support_modules.index_file import read_index_rows
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from src.scrappers.job_lab_scraper import JobLabScraper
+
+
+@dataclass
+class CrawlQuery:
+    path: str
+    priority: int = 1
+    max_pages: int = field(default_factory=lambda: settings.MAX_NUM_PAGES_WITH_LINKS)
+    recrawl_hours: float = 24.0
+
+
+@dataclass
+class _QueryProgress:
+    query: CrawlQuery
+    next_url: str
+    pages: int = 0
+    weight: int = 0
+    links: List[str] = field(default_factory=list)
+
+
+class CrawlScheduler:
+    """
+    Crawls many listing paths in one run. Listing pages of all due queries are interleaved
+    by smooth weighted round-robin on their priorities, each query stops at its page budget,
+    and resume links found by several queries are fetched once. The state file remembers
+    when each query and each resume was last crawled, so queries and resumes fetched within
+    ``recrawl_hours`` are skipped.
+
+    Query times and pending links are kept in the JSON state file. Resume crawl times are
+    appended to a ``.resumes.tsv`` file next to it, which is compacted on load by dropping
+    entries older than the largest ``recrawl_hours``, so saves do not grow with the history.
+
+    State is saved as the run goes: a query is marked crawled once its listing pages are done
+    and its links are queued as pending, and resumes are scraped in batches whose rows are
+    appended to this run's output file before their links leave the queue. Resumes that failed stay
+    pending and are retried by later runs, up to ``max_attempts`` times; after that they are
+    treated as crawled, so a deleted resume is tried again only after ``recrawl_hours``.
+    """
+
+    def __init__(
+        self,
+        scraper: 'JobLabScraper',
+        queries: List[CrawlQuery],
+        state_path: str = None,
+        output_path: str = None,
+        batch_size: int = 50,
+        max_attempts: int = 3,
+    ) -> None:
+        """
+        Args:
+            scraper (JobLabScraper): Scraper whose driver and rate limiter are shared by all queries.
+            queries (List[CrawlQuery]): Listing paths to crawl.
+            state_path (str, optional): JSON file with crawl state, kept in memory only by default.
+            output_path (str, optional): CSV file name, every run writes its rows to a copy of it
+                suffixed with the run start time, e.g. ``resumes-20240501-120000.csv``.
+            batch_size (int): Number of resumes scraped between state saves.
+            max_attempts (int): Number of failed attempts after which a resume is given up.
+        """
+        self.scraper = scraper
+        self.queries = queries
+        self.state_path = Path(state_path) if state_path else None
+        self.resumes_path = self.state_path.with_suffix('.resumes.tsv') if self.state_path else None
+        self.output_path = Path(output_path) if output_path else None
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.state = self._load_state()
+        self.resumes = self._load_resumes()
+
+    @staticmethod
+    def load_queries(queries_path: str) -> List[CrawlQuery]:
+        """
+        Loads queries from a JSON list of objects with CrawlQuery fields.
+
+        Args:
+            queries_path (str): Path to the JSON file.
+
+        Returns:
+            List[CrawlQuery]: Parsed queries.
+        """
+        with open(queries_path, 'r', encoding='utf-8') as queries_file:
+            return [CrawlQuery(**query) for query in json.load(queries_file)]
+
+    def _load_state(self) -> Dict[str, Dict[str, any]]:
+        state = {}
+        if self.state_path and self.state_path.exists():
+            with open(self.state_path, 'r', encoding='utf-8') as state_file:
+                state = json.load(state_file)
+        return {key: state.get(key, {}) for key in ('queries', 'pending')}
+
+    def _save_state(self) -> None:
+        if self.state_path:
+            tmp_path = self.state_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as state_file:
+                json.dump(self.state, state_file)
+            tmp_path.replace(self.state_path)
+
+    def _load_resumes(self) -> Dict[str, float]:
+        if self.resumes_path is None:
+            return {}
+        rows = read_index_rows(self.resumes_path, columns=2)
+        # Entries past the longest recrawl interval can no longer make a resume fresh
+        horizon = time.time() - max((query.recrawl_hours for query in self.queries), default=0) * 3600
+        resumes = {}
+        for link, crawled_at in rows:
+            try:
+                crawled_at = float(crawled_at)
+            except ValueError:
+                logger.warning(f'Skipping malformed entry in {self.resumes_path}: {link!r}')
+                continue
+            # Entries are appended in time order, so the last one of a link is its latest crawl
+            if crawled_at >= horizon:
+                resumes[link] = crawled_at
+
+        if len(resumes) < len(rows):
+            logger.info(f'Compacting {self.resumes_path}: {len(rows)} -> {len(resumes)} entries')
+            tmp_path = self.resumes_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as resumes_file:
+                resumes_file.writelines(f'{link}\t{crawled_at}\n' for link, crawled_at in resumes.items())
+            tmp_path.replace(self.resumes_path)
+        return resumes
+
+    def _mark_resumes(self, links: List[str], crawled_at: float) -> None:
+        for link in links:
+            self.resumes[link] = crawled_at
+        if self.resumes_path is not None and links:
+            with open(self.resumes_path, 'a', encoding='utf-8') as resumes_file:
+                resumes_file.writelines(f'{link}\t{crawled_at}\n' for link in links)
+
+    @staticmethod
+    def _is_fresh(last_crawled: float, recrawl_hours: float, now: float) -> bool:
+        return last_crawled is not None and now - last_crawled < recrawl_hours * 3600
+
+    def _finish_query(self, progress: _QueryProgress, now: float) -> None:
+        pending = self.state['pending']
+        for link in progress.links:
+            # The first query to queue a link owns it until it is scraped
+            if link not in pending and not self._is_fresh(
+                self.resumes.get(link), progress.query.recrawl_hours, now
+            ):
+                pending[link] = {'query': progress.query.path, 'attempts': 0}
+        self.state['queries'][progress.query.path] = now
+        self._save_state()
+        logger.info(f'Query {progress.query.path} done after {progress.pages} pages')
+
+    def _collect_links(self, queries: List[CrawlQuery], now: float) -> None:
+        active = [
+            _QueryProgress(query=query, next_url=f'{self.scraper.BASE_URL}{query.path}')
+            for query in queries
+        ]
+        total_priority = sum(progress.query.priority for progress in active)
+        while active:
+            for progress in active:
+                progress.weight += progress.query.priority
+            current = max(active, key=lambda progress: progress.weight)
+            current.weight -= total_priority
+
+            try:
+                page_links, current.next_url = self.scraper.scrape_listing_page(current.next_url)
+            except Exception as e:
+                # The query stays due and is crawled again by the next run
+                logger.error(f'Query {current.query.path} failed on {current.next_url}: {e}')
+                active.remove(current)
+                total_priority -= current.query.priority
+                continue
+            current.pages += 1
+            current.links.extend(page_links)
+
+            if not current.next_url or current.pages >= current.query.max_pages:
+                self._finish_query(current, now)
+                active.remove(current)
+                total_priority -= current.query.priority
+
+    def _run_output_path(self, started: float) -> Path:
+        run_suffix = time.strftime('%Y%m%d-%H%M%S', time.localtime(started))
+        stem, suffix = self.output_path.stem, self.output_path.suffix
+        output_path = self.output_path.with_name(f'{stem}-{run_suffix}{suffix}')
+        # Runs started within the same second must not overwrite each other
+        copy_number = 1
+        while output_path.exists():
+            output_path = self.output_path.with_name(f'{stem}-{run_suffix}-{copy_number}{suffix}')
+            copy_number += 1
+        return output_path
+
+    @staticmethod
+    def _save_rows(data: 'pd.DataFrame', output_path: Path, saved: int) -> None:
+        # The file belongs to this run, so its header is written once and the index continues
+        data.index += saved
+        data.to_csv(output_path, mode='a' if saved else 'w', header=not saved)
+
+    def run(self) -> int:
+        """
+        Crawls listing pages of all due queries and scrapes pending resumes in batches.
+
+        Returns:
+            int: Number of resumes scraped by this run.
+        """
+        now = time.time()
+        output_path = self._run_output_path(now) if self.output_path else None
+        due = [
+            query for query in self.queries
+            if not self._is_fresh(self.state['queries'].get(query.path), query.recrawl_hours, now)
+        ]
+        logger.info(f'Queries due: {[query.path for query in due]}')
+        self._collect_links(sorted(due, key=lambda query: -query.priority), now)
+
+        pending = self.state['pending']
+        resume_links = list(pending)
+        logger.info(f'Resume links to scrape: {len(resume_links)}')
+
+        saved = 0
+        for start in range(0, len(resume_links), self.batch_size):
+            batch = resume_links[start:start + self.batch_size]
+            data = self.scraper.scrape_resumes(batch)
+            if output_path is not None:
+                self._save_rows(data, output_path, saved)
+            saved += len(data)
+
+            scraped = set(data['Resume link'])
+            done = []
+            for link in batch:
+                if f'{self.scraper.BASE_URL}{link}' not in scraped:
+                    pending[link]['attempts'] += 1
+                    if pending[link]['attempts'] < self.max_attempts:
+                        continue
+                    logger.warning(f'Giving up on resume {link} after {self.max_attempts} failed attempts')
+                done.append(link)
+                del pending[link]
+            self._mark_resumes(done, time.time())
+            self._save_state()
+
+        logger.info(f'Resumes left pending after failures: {len(pending)}')
+        if output_path is not None and saved:
+            logger.info(f'Rows saved to {output_path}')
+        return saved
@@ -0,0 +1,109 @@
+import sys
+from pprint import pformat
+from typing import List, Dict, TYPE_CHECKING
+
+from loguru import logger
+
+from src.scrappers.resume_record import ResumeRecord
+from src.support_modules.photo_constants import NO_IMAGE
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+
+class JobLabDataParser:
+    @staticmethod
+    def extract_text(soup: 'BeautifulSoup', section_title: str) -> str:
+        section = soup.find('p', string=section_title)
+        if section:
+            section = soup.find('p', string=section_title).parent
+            second_parent = section.parent
+            result = second_parent.find_all(recursive=False)[1].text.strip()
+            logger.debug(
+                f'\nFor field:\t {section_title}\n'
+                f'Extracted text:\t{result}'
+            )
+            return result
+        else:
+            return 'Not Available'
+
+    @staticmethod
+    def extract_photo_url(soup: 'BeautifulSoup') -> str:
+        img_div = soup.find('div', class_='resume_img')
+        if img_div:
+            style = img_div['style']
+            result = style.split('url(')[1].split(')')[0].strip() if style else NO_IMAGE
+            return result
+        else:
+            return NO_IMAGE
+
+    @staticmethod
+    def extract_detailed_block(soup: 'BeautifulSoup', block_title: str) -> Dict[str, Dict[str, str]]:
+        h2_block = soup.find('h2', string=block_title)
+
+        result_dict = {sys.intern(block_title): {}}
+
+        if h2_block:
+            for sibling in h2_block.find_parent('tr').find_next_siblings('tr'):
+                if len(sibling.find_all('td')) <= 1:
+                    break
+                key = sibling.find_all('td')[0].get_text(strip=True)
+                value = sibling.find_all('td')[1].get_text(strip=True)
+                # Section keys repeat across resumes, share them instead of keeping a copy per record
+                result_dict[block_title][sys.intern(key)] = value
+        return result_dict
+
+    @staticmethod
+    def extract_block_with_sub_blocks(soup: 'BeautifulSoup', block_title: str) -> List[Dict[str, Dict[str, str]]]:
+        # Find the 'Образование' section
+        education_header = soup.find('h2', string=block_title)
+
+        result_data = []
+        current_block_data = {}
+
+        if education_header:
+            for sibling in education_header.find_parent('tr').find_next_siblings('tr'):
+                # Check for stopping conditions
+                if len(sibling.find_all('td')) <= 1:
+                    if current_block_data:
+                        result_data.append(current_block_data)
+                        return result_data
+                else:
+                    key, value = (cell.get_text(strip=True) for cell in sibling.find_all('td'))
+                    current_block_data[sys.intern(key)] = value
+
+                if sibling.find('hr') is not None:
+                    if current_block_data:
+                        result_data.append(current_block_data)
+                    current_block_data = {}
+
+        if current_block_data:
+            result_data.append(current_block_data)
+        return result_data
+
+    @staticmethod
+    def parse_resume(soup: 'BeautifulSoup', resume_link: str) -> ResumeRecord:
+        # Short categorical values repeat across most resumes, so they are interned
+        resume_data = ResumeRecord(
+            title=soup.find('h1').text.strip(),
+            name=JobLabDataParser.extract_text(soup, 'Имя'),
+            contact=JobLabDataParser.extract_text(soup, 'Контакты'),
+            photo_url=JobLabDataParser.extract_photo_url(soup),
+            accommodation=sys.intern(JobLabDataParser.extract_text(soup, 'Проживание')),
+            wage=sys.intern(JobLabDataParser.extract_text(soup, 'Заработная плата')),
+            schedule=sys.intern(JobLabDataParser.extract_text(soup, 'График работы')),
+            education=JobLabDataParser.extract_text(soup, 'Образование'),
+            experience=JobLabDataParser.extract_text(soup, 'Опыт работы'),
+            citizenship=sys.intern(JobLabDataParser.extract_text(soup, 'Гражданство')),
+            gender=sys.intern(JobLabDataParser.extract_text(soup, 'Пол')),
+            age=sys.intern(JobLabDataParser.extract_text(soup, 'Возраст')),
+            experience_detailed=JobLabDataParser.extract_block_with_sub_blocks(soup, 'Опыт работы'),
+            education_detailed=JobLabDataParser.extract_detailed_block(soup, 'Образование'),
+            additional_info=JobLabDataParser.extract_detailed_block(soup, 'Дополнительная информация'),
+            resume_link=resume_link,
+        )
+        logger.debug(
+            f'\nParsed data from:\t {resume_link}\n'
+            f'{pformat(resume_data)}'
+        )
+        return resume_data
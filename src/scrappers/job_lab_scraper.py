@@ -0,0 +1,144 @@
+from typing import List, Tuple
+
+import pandas as pd
+import undetected_chromedriver as uc
+from bs4 import BeautifulSoup
+from loguru import logger
+from selenium.common import NoSuchElementException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.webdriver import WebDriver
+from selenium.webdriver.common.by import By
+
+from settings.config import settings
+from src.scrappers.job_lab_parser import JobLabDataParser
+from src.scrappers.resume_record import ResumeRecord
+from src.support_modules.page_archive import PageArchive
+from src.support_modules.photo_store import PhotoDownloader
+from src.support_modules.rate_limiter import RateLimiter
+
+
+class JobLabScraper:
+    BASE_URL = 'https://joblab.ru'
+
+    def __init__(
+        self,
+        archive: PageArchive = None,
+        rate_limiter: RateLimiter = None,
+        photo_downloader: PhotoDownloader = None,
+    ):
+        self.__driver = self.__init_driver()
+        self.__archive = archive
+        self.__rate_limiter = rate_limiter or RateLimiter(settings.SLEEEP_BETWEEN_REQUESTS)
+        self.__photo_downloader = photo_downloader
+
+    @staticmethod
+    def __init_driver() -> WebDriver:
+        try:
+            _options: Options = Options()
+            _options.add_argument(argument='--headless')
+            _options.add_argument(argument='--disable-gpu')
+            driver: WebDriver = uc.Chrome(options=_options)
+            logger.info('Chrome driver started in headless mode')
+            return driver
+        except WebDriverException as e:
+            logger.error(f'Failed to initialize driver: {e}')
+            raise
+
+    def scrape(self, path: str = '/resume') -> pd.DataFrame:
+        _links = self.__scrape_resume_links(f'{self.BASE_URL}{path}')
+        data = self.__collect_data(_links)
+        return data
+
+    def scrape_listing_page(self, url: str) -> Tuple[List[str], str]:
+        self.__rate_limiter.wait()
+        self.__driver.get(url)
+        links = self.__extract_links(url)
+        logger.info(f'Page {url} parsed. Links: {links}')
+        return links, self.__next_page_url()
+
+    def scrape_resumes(self, links: List[str]) -> pd.DataFrame:
+        # Used by the crawl scheduler, which keeps failed links pending for a later run
+        return self.__collect_data(links, skip_failed=True)
+
+    def __scrape_resume_links(self, start_url: str) -> List[str]:
+        logger.info('Scrapping links')
+        self.__rate_limiter.wait()
+        self.__driver.get(start_url)
+        links: List[str] = []
+        page_number = 1
+        while self.__has_next_page():
+            parsed_links = self.__extract_links(self.__driver.current_url)
+            links.extend(parsed_links)
+            logger.info(f'Page {page_number} parsed. Links: {parsed_links}')
+            self.__rate_limiter.wait()
+            self.__go_to_next_page()
+
+            if page_number == settings.MAX_NUM_PAGES_WITH_LINKS:
+                return links
+            page_number += 1
+
+        return links
+
+    def __page_source(self, url: str, kind: str) -> str:
+        # Archived under the requested URL, so reparse gives the same Resume link after a redirect
+        page_source = self.__driver.page_source
+        if self.__archive is not None:
+            self.__archive.append(url, page_source, kind=kind)
+        return page_source
+
+    def __extract_links(self, url: str) -> List[str]:
+        _soup = BeautifulSoup(self.__page_source(url, kind='listing'), 'html.parser')
+        return [a['href'] for a in _soup.select('p.prof a')]
+
+    def __has_next_page(self) -> bool:
+        try:
+            self.__driver.find_element(By.LINK_TEXT, 'Следующая →')
+            return True
+        except NoSuchElementException:
+            logger.info('No next page button found.')
+            return False
+
+    def __next_page_url(self) -> str:
+        try:
+            return self.__driver.find_element(By.LINK_TEXT, 'Следующая →').get_attribute('href')
+        except NoSuchElementException:
+            logger.info('No next page button found.')
+            return ''
+
+    def __go_to_next_page(self) -> None:
+        try:
+            _next_button = self.__driver.find_element(By.LINK_TEXT, 'Следующая →')
+            _next_button.click()
+        except NoSuchElementException:
+            logger.info('Cannot navigate to next page, next button not found.')
+
+    def __collect_data(self, links: List[str], skip_failed: bool = False) -> pd.DataFrame:
+        logger.info('Scrapping data from resume pages')
+        _resumes = []
+        for link in links:
+            self.__rate_limiter.wait()
+            try:
+                resume = self.__scrape_resume_page(resume_url=f'{self.BASE_URL}{link}')
+            except Exception as e:
+                if not skip_failed:
+                    raise
+                logger.error(f'Failed to scrape resume {link}: {e}')
+                continue
+            if self.__photo_downloader is not None:
+                # Photos download in the background while the next pages are crawled
+                self.__photo_downloader.submit(resume.photo_url)
+            _resumes.append(resume)
+        if self.__photo_downloader is not None:
+            self.__photo_downloader.fill_hashes(_resumes)
+        return ResumeRecord.to_dataframe(_resumes)
+
+    def __scrape_resume_page(self, resume_url: str) -> ResumeRecord:
+        self.__driver.get(resume_url)
+        soup = BeautifulSoup(self.__page_source(resume_url, kind='resume'), 'html.parser')
+        return JobLabDataParser.parse_resume(soup, resume_link=resume_url)
+
+    def __del__(self):
+        try:
+            self.__driver.quit()
+        except Exception as e:
+            logger.error(f"Failed to quit the driver cleanly: {str(e)}")
@@ -1,17 +1,22 @@
+from typing import TYPE_CHECKING
+
 from base import abc_classes
 
 import pandas as pd
-import undetected_chromedriver as uc
-from bs4 import BeautifulSoup
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.webdriver import WebDriver
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+    from selenium.webdriver.chrome.webdriver import WebDriver
 
 
 class JobLabDriverManager(abc_classes.DriverManagerABC):
     def __init__(self, driver_path: str, headless: bool = True) -> None:
         super().__init__(driver_path=driver_path, headless=headless)
 
-    def _init_driver(self) -> WebDriver:
+    def _init_driver(self) -> 'WebDriver':
+        import undetected_chromedriver as uc
+        from selenium.webdriver.chrome.options import Options
+
         options = Options()
         if self.headless:
             options.add_argument('--headless')
@@ -34,17 +39,17 @@ class JobLabScraper(abc_classes.ScraperABC):
 
 class JobLabDataExtractor(abc_classes.DataExtractorABC):
     @staticmethod
-    def extract_text(soup: BeautifulSoup, selector: str) -> str:
+    def extract_text(soup: 'BeautifulSoup', selector: str) -> str:
         element = soup.select_one(selector)
         return element.text.strip() if element else ''
 
     @staticmethod
-    def extract_attribute(soup: BeautifulSoup, selector: str, attribute: str) -> str:
+    def extract_attribute(soup: 'BeautifulSoup', selector: str, attribute: str) -> str:
         element = soup.select_one(selector)
         return element[attribute] if element and attribute in element.attrs else ''
 
     @staticmethod
-    def extract_links(soup: BeautifulSoup, selector: str) -> list:
+    def extract_links(soup: 'BeautifulSoup', selector: str) -> list:
         elements = soup.select(selector)
         return [element['href'] for element in elements if 'href' in element.attrs]
 
@@ -0,0 +1,123 @@
+import sys
+from operator import attrgetter
+from typing import Dict, List, TYPE_CHECKING
+
+from pydantic.dataclasses import dataclass
+
+from src.support_modules.photo_constants import NO_PHOTO_HASH
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Output column for every record field, in output order
+COLUMNS: Dict[str, str] = {
+    'title': 'Title',
+    'name': 'Name',
+    'contact': 'Contact',
+    'photo_url': 'Photo_url',
+    'accommodation': 'Accommodation',
+    'wage': 'Wage',
+    'schedule': 'Schedule',
+    'education': 'Education',
+    'experience': 'Experience',
+    'citizenship': 'Citizenship',
+    'gender': 'Gender',
+    'age': 'Age',
+    'experience_detailed': 'Experience detailed',
+    'education_detailed': 'Education detailed',
+    'additional_info': 'Additional info',
+    'resume_link': 'Resume link',
+    'photo_hash': 'Photo_hash',
+}
+
+# Short fields whose values repeat across most resumes, interned by the parser
+INTERNED_FIELDS = ('accommodation', 'wage', 'schedule', 'citizenship', 'gender', 'age')
+
+_get_values = attrgetter(*COLUMNS)
+
+
+def _intern_keys(block: Dict[str, any]) -> Dict[str, any]:
+    return {sys.intern(key): value for key, value in block.items()}
+
+
+def _unpickle(*values: any) -> 'ResumeRecord':
+    # Strings arriving from worker processes are fresh copies, so intern them like the parser does
+    kwargs = dict(zip(COLUMNS, values))
+    for field in INTERNED_FIELDS:
+        kwargs[field] = sys.intern(kwargs[field])
+    kwargs['experience_detailed'] = [_intern_keys(block) for block in kwargs['experience_detailed']]
+    for field in ('education_detailed', 'additional_info'):
+        kwargs[field] = {
+            sys.intern(title): _intern_keys(block) for title, block in kwargs[field].items()
+        }
+    return ResumeRecord(**kwargs)
+
+
+@dataclass(slots=True)
+class ResumeRecord:
+    """
+    Parsed resume, validated on creation. The parser interns section keys and short
+    categorical values so that large crawls share them; validation keeps them as they are.
+    """
+
+    title: str
+    name: str
+    contact: str
+    photo_url: str
+    accommodation: str
+    wage: str
+    schedule: str
+    education: str
+    experience: str
+    citizenship: str
+    gender: str
+    age: str
+    experience_detailed: List[Dict[str, str]]
+    education_detailed: Dict[str, Dict[str, str]]
+    additional_info: Dict[str, Dict[str, str]]
+    resume_link: str
+    photo_hash: str = NO_PHOTO_HASH
+
+    def __reduce__(self) -> tuple:
+        # Rebuild through _unpickle so records returned by worker processes are interned again
+        return _unpickle, _get_values(self)
+
+    def to_dict(self) -> Dict[str, any]:
+        """
+        Returns:
+            Dict[str, any]: Record keyed by output column names.
+        """
+        return dict(zip(COLUMNS.values(), _get_values(self)))
+
+    @staticmethod
+    def to_columns(records: List['ResumeRecord']) -> Dict[str, list]:
+        """
+        Transposes records into per-column lists without building a dict per record.
+
+        Args:
+            records (List[ResumeRecord]): Records to transpose.
+
+        Returns:
+            Dict[str, list]: Values keyed by output column names.
+        """
+        if not records:
+            return {column: [] for column in COLUMNS.values()}
+        return {
+            column: list(values)
+            for column, values in zip(COLUMNS.values(), zip(*map(_get_values, records)))
+        }
+
+    @staticmethod
+    def to_dataframe(records: List['ResumeRecord']) -> 'pd.DataFrame':
+        """
+        Builds a DataFrame with the output columns from records.
+
+        Args:
+            records (List[ResumeRecord]): Records to convert.
+
+        Returns:
+            pd.DataFrame: One row per record.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(ResumeRecord.to_columns(records), columns=list(COLUMNS.values()))
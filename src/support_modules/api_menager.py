@@ -1,4 +1,7 @@
-from requests import Session, Response
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from requests import Response
 
 
 class APIManager:
@@ -7,12 +10,14 @@ class APIManager:
     """
 
     def __init__(self, base_url: str) -> None:
+        from requests import Session
+
         self.base_url = base_url
         self.session = Session()
 
     def send_request(
         self, endpoint: str, params: dict = None, method: str = 'GET', data: dict = None
-    ) -> Response:
+    ) -> 'Response':
         """
         Sends a request to the specified API endpoint.
 
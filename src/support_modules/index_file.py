@@ -0,0 +1,41 @@
+from pathlib import Path
+from typing import List
+
+from loguru import logger
+
+
+def read_index_rows(index_path: Path, columns: int, truncate: bool = True) -> List[List[str]]:
+    """
+    Reads the rows of an append-only, tab-separated index file.
+
+    A last line without a newline was cut off by an interrupted write. It is dropped and,
+    when ``truncate`` is set, removed from the file so that the next append starts on a
+    fresh line. Lines with a wrong number of columns are skipped.
+
+    Args:
+        index_path (Path): Index file, a missing file reads as empty.
+        columns (int): Expected number of columns.
+        truncate (bool): Remove an incomplete last line from the file.
+
+    Returns:
+        List[List[str]]: Column values of every complete, well-formed line.
+    """
+    if not index_path.exists():
+        return []
+    with open(index_path, 'rb') as index_file:
+        data = index_file.read()
+    complete_size = data.rfind(b'\n') + 1
+    if complete_size < len(data):
+        logger.warning(f'Dropping incomplete last line of {index_path}')
+        if truncate:
+            with open(index_path, 'r+b') as index_file:
+                index_file.truncate(complete_size)
+
+    rows = []
+    for line in data[:complete_size].decode('utf-8', errors='replace').splitlines():
+        row = line.split('\t')
+        if len(row) != columns:
+            logger.warning(f'Skipping malformed line in {index_path}: {line!r}')
+            continue
+        rows.append(row)
+    return rows
@@ -0,0 +1,226 @@
+import mmap
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import zstandard
+from loguru import logger
+
+from src.support_modules.index_file import read_index_rows
+
+# (segment, offset, length) of a compressed page inside the archive
+Entry = Tuple[int, int, int]
+
+
+class SegmentReader:
+    """
+    Reads compressed pages straight from mmapped segments, without the URL index. Used by
+    reparse workers that receive index entries from the parent process.
+    """
+
+    def __init__(self, root_dir: str) -> None:
+        """
+        Args:
+            root_dir (str): Directory holding the segments.
+        """
+        self.root_dir = Path(root_dir)
+        self._decompressor = zstandard.ZstdDecompressor()
+        self._maps: Dict[int, mmap.mmap] = {}
+
+    def _map_segment(self, segment: int, end: int) -> mmap.mmap:
+        segment_map = self._maps.get(segment)
+        # The active segment grows while crawling, so remap it once reads go past the old end
+        if segment_map is None or len(segment_map) < end:
+            if segment_map is not None:
+                segment_map.close()
+            segment_path = self.root_dir / PageArchive.SEGMENT_TEMPLATE.format(segment)
+            with open(segment_path, 'rb') as segment_file:
+                segment_map = mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = segment_map
+        return segment_map
+
+    def read(self, segment: int, offset: int, length: int) -> str:
+        """
+        Reads a single page.
+
+        Args:
+            segment (int): Segment number.
+            offset (int): Offset of the compressed page in the segment.
+            length (int): Length of the compressed page.
+
+        Returns:
+            str: Page source.
+        """
+        segment_map = self._map_segment(segment, offset + length)
+        record = self._decompressor.decompress(segment_map[offset:offset + length])
+        _, body = record.split(b'\r\n\r\n', 1)
+        return body[:-4].decode('utf-8')
+
+    def close(self) -> None:
+        for segment_map in self._maps.values():
+            segment_map.close()
+        self._maps.clear()
+
+
+class PageArchive:
+    """
+    Append-only archive of fetched HTML pages stored as zstd-compressed, WARC-like segments.
+
+    Every page is written as an independent zstd frame holding a WARC-style header and the
+    page body, so any single page can be read back through mmap without touching the rest
+    of the segment. The ``index.tsv`` file maps each URL to its page kind, segment, offset
+    and length; the latest copy of a URL wins. The archive expects a single writer at a time.
+    """
+
+    INDEX_FILE = 'index.tsv'
+    SEGMENT_TEMPLATE = 'segment-{:05d}.warc.zst'
+
+    def __init__(
+        self,
+        root_dir: str,
+        read_only: bool = False,
+        segment_max_bytes: int = 256 * 1024 ** 2,
+        compression_level: int = 3,
+    ) -> None:
+        """
+        Open the archive and load the URL index. The directory is created on the first append.
+
+        Args:
+            root_dir (str): Directory holding segments and the index.
+            read_only (bool): Open an existing archive for reading only.
+            segment_max_bytes (int): Size after which a new segment is started.
+            compression_level (int): zstd compression level for new records.
+
+        Raises:
+            FileNotFoundError: If ``read_only`` is set and there is no archive in ``root_dir``.
+        """
+        self.root_dir = Path(root_dir)
+        self.read_only = read_only
+        if read_only and not (self.root_dir / self.INDEX_FILE).exists():
+            raise FileNotFoundError(f'No page archive found in {self.root_dir}')
+        self.segment_max_bytes = segment_max_bytes
+        self._compressor = zstandard.ZstdCompressor(level=compression_level)
+        self._reader = SegmentReader(root_dir)
+        self._index: Dict[str, Tuple[str, int, int, int]] = self._load_index()
+        self._segment_number = max((entry[1] for entry in self._index.values()), default=0)
+
+    def _load_index(self) -> Dict[str, Tuple[str, int, int, int]]:
+        index = {}
+        index_path = self.root_dir / self.INDEX_FILE
+        rows = read_index_rows(index_path, columns=5, truncate=not self.read_only)
+        for url, kind, segment, offset, length in rows:
+            try:
+                entry = (kind, int(segment), int(offset), int(length))
+            except ValueError:
+                logger.warning(f'Skipping malformed entry in {index_path}: {url!r}')
+                continue
+            index.pop(url, None)
+            index[url] = entry
+        return index
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.root_dir / self.SEGMENT_TEMPLATE.format(segment)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._index
+
+    def urls(self, kind: str = None) -> List[str]:
+        """
+        Lists archived URLs in the order they were last written.
+
+        Args:
+            kind (str, optional): Return only pages of this kind, all pages by default.
+
+        Returns:
+            List[str]: Archived URLs.
+        """
+        return [url for url, entry in self._index.items() if kind is None or entry[0] == kind]
+
+    def entries(self, kind: str = None) -> List[Tuple[str, Entry]]:
+        """
+        Lists index entries ordered by position in the archive, for sequential reads.
+
+        Args:
+            kind (str, optional): Return only pages of this kind, all pages by default.
+
+        Returns:
+            List[Tuple[str, Entry]]: URL with its segment, offset and length.
+        """
+        entries = [
+            (url, entry[1:]) for url, entry in self._index.items() if kind is None or entry[0] == kind
+        ]
+        return sorted(entries, key=lambda url_entry: url_entry[1])
+
+    def append(self, url: str, html: str, kind: str = 'page') -> None:
+        """
+        Compresses a page and appends it to the current segment.
+
+        Args:
+            url (str): URL the page was fetched from.
+            html (str): Page source.
+            kind (str, optional): Page kind used to select pages on reparse, e.g. 'listing' or 'resume'.
+        """
+        if self.read_only:
+            raise PermissionError(f'Page archive {self.root_dir} is opened read-only')
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+
+        body = html.encode('utf-8')
+        header = (
+            'WARC/1.0\r\n'
+            'WARC-Type: response\r\n'
+            f'WARC-Target-URI: {url}\r\n'
+            f'WARC-Date: {datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")}\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            '\r\n'
+        ).encode('utf-8')
+        frame = self._compressor.compress(header + body + b'\r\n\r\n')
+
+        segment_path = self._segment_path(self._segment_number)
+        if segment_path.exists() and segment_path.stat().st_size + len(frame) > self.segment_max_bytes:
+            self._segment_number += 1
+            segment_path = self._segment_path(self._segment_number)
+
+        with open(segment_path, 'ab') as segment_file:
+            offset = segment_file.tell()
+            segment_file.write(frame)
+        with open(self.root_dir / self.INDEX_FILE, 'a', encoding='utf-8') as index_file:
+            index_file.write(f'{url}\t{kind}\t{self._segment_number}\t{offset}\t{len(frame)}\n')
+
+        self._index.pop(url, None)
+        self._index[url] = (kind, self._segment_number, offset, len(frame))
+
+    def get(self, url: str) -> str:
+        """
+        Reads a single page from the archive.
+
+        Args:
+            url (str): URL of the archived page.
+
+        Returns:
+            str: Page source.
+
+        Raises:
+            KeyError: If the URL is not in the archive.
+        """
+        _, segment, offset, length = self._index[url]
+        return self._reader.read(segment, offset, length)
+
+    def iter_pages(self, urls: List[str] = None, kind: str = None) -> Iterator[Tuple[str, str]]:
+        """
+        Streams pages from the archive one at a time.
+
+        Args:
+            urls (List[str], optional): URLs to read, all archived pages by default.
+            kind (str, optional): Page kind to read when ``urls`` is not given.
+
+        Yields:
+            Tuple[str, str]: URL and page source.
+        """
+        for url in self.urls(kind) if urls is None else urls:
+            yield url, self.get(url)
+
+    def close(self) -> None:
+        self._reader.close()
@@ -0,0 +1,5 @@
+# Photo URL the parser returns for resumes without a photo
+NO_IMAGE = 'No Image'
+
+# Photo hash of resumes whose photo was not downloaded. Not empty, so CSV readers keep the row
+NO_PHOTO_HASH = 'Not Available'
@@ -0,0 +1,161 @@
+import hashlib
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, TYPE_CHECKING
+from urllib.parse import urljoin
+
+from loguru import logger
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from src.support_modules.index_file import read_index_rows
+from src.support_modules.photo_constants import NO_IMAGE, NO_PHOTO_HASH
+from src.support_modules.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    from src.scrappers.resume_record import ResumeRecord
+
+
+class PhotoStore:
+    """
+    Content-addressed store of resume photos. Files are named by the sha256 of their content,
+    so an image shared by several resumes is kept once. ``url_index.tsv`` remembers which
+    hash every downloaded URL resolved to.
+    """
+
+    INDEX_FILE = 'url_index.tsv'
+
+    def __init__(self, root_dir: str) -> None:
+        """
+        Args:
+            root_dir (str): Directory holding photos and the URL index.
+        """
+        self.root_dir = Path(root_dir)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._url_hashes: Dict[str, str] = self._load_index()
+
+    def _load_index(self) -> Dict[str, str]:
+        return dict(read_index_rows(self.root_dir / self.INDEX_FILE, columns=2))
+
+    def path_for(self, content_hash: str) -> Path:
+        return self.root_dir / content_hash[:2] / content_hash
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._url_hashes
+
+    def hash_for(self, url: str) -> str:
+        """
+        Returns:
+            str: Hash of the photo previously downloaded from ``url``, NO_PHOTO_HASH if unknown.
+        """
+        return self._url_hashes.get(url, NO_PHOTO_HASH)
+
+    def put(self, url: str, content: bytes) -> str:
+        """
+        Stores photo content unless identical content is already present.
+
+        Args:
+            url (str): URL the photo was downloaded from.
+            content (bytes): Photo content.
+
+        Returns:
+            str: sha256 hex digest of the content.
+        """
+        content_hash = hashlib.sha256(content).hexdigest()
+        photo_path = self.path_for(content_hash)
+        with self._lock:
+            if not photo_path.exists():
+                photo_path.parent.mkdir(exist_ok=True)
+                tmp_path = photo_path.with_suffix('.tmp')
+                tmp_path.write_bytes(content)
+                os.replace(tmp_path, photo_path)
+            with open(self.root_dir / self.INDEX_FILE, 'a', encoding='utf-8') as index_file:
+                index_file.write(f'{url}\t{content_hash}\n')
+            self._url_hashes[url] = content_hash
+        return content_hash
+
+
+class PhotoDownloader:
+    """
+    Downloads resume photos in background threads into a PhotoStore. Requests go through
+    the shared RateLimiter and a pooled Session; URLs already in the store or already
+    submitted are not fetched again.
+    """
+
+    def __init__(
+        self,
+        store: PhotoStore,
+        rate_limiter: RateLimiter,
+        base_url: str,
+        workers: int = 4,
+        session: Session = None,
+    ) -> None:
+        """
+        Args:
+            store (PhotoStore): Store for downloaded photos.
+            rate_limiter (RateLimiter): Rate limiter shared with the crawler.
+            base_url (str): Base URL for relative photo URLs.
+            workers (int): Number of concurrent downloads.
+            session (Session, optional): Session to reuse, a pooled one is created by default.
+        """
+        self.store = store
+        self.rate_limiter = rate_limiter
+        self.base_url = base_url
+        if session is None:
+            session = Session()
+            session.mount('https://', HTTPAdapter(pool_maxsize=workers))
+            session.mount('http://', HTTPAdapter(pool_maxsize=workers))
+        self.session = session
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='photo')
+        self._futures: Dict[str, Future] = {}
+
+    def _download(self, url: str) -> str:
+        try:
+            self.rate_limiter.wait()
+            response = self.session.get(urljoin(self.base_url, url), timeout=30)
+            response.raise_for_status()
+            return self.store.put(url, response.content)
+        except Exception as e:
+            logger.error(f'Failed to download photo {url}: {e}')
+            return NO_PHOTO_HASH
+
+    def submit(self, photo_url: str) -> Future:
+        """
+        Schedules a photo download.
+
+        Args:
+            photo_url (str): Photo URL as extracted from the resume.
+
+        Returns:
+            Future: Resolves to the content hash, NO_IMAGE if the resume has no photo or
+                NO_PHOTO_HASH if the download failed.
+        """
+        url = photo_url.strip('\'"')
+        future = self._futures.get(url)
+        if future is None:
+            future = Future()
+            if url == NO_IMAGE:
+                future.set_result(NO_IMAGE)
+            elif url in self.store:
+                future.set_result(self.store.hash_for(url))
+            else:
+                future = self._executor.submit(self._download, url)
+            self._futures[url] = future
+        return future
+
+    def fill_hashes(self, records: List['ResumeRecord']) -> None:
+        """
+        Downloads photos for all records and stores their hashes in ``photo_hash``.
+
+        Args:
+            records (List[ResumeRecord]): Records to update.
+        """
+        futures = [self.submit(record.photo_url) for record in records]
+        for record, future in zip(records, futures):
+            record.photo_hash = future.result()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,29 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Spaces out requests to the site. One instance is shared by the crawler and background
+    downloaders so that together they stay within the configured request rate.
+    """
+
+    def __init__(self, min_interval: float) -> None:
+        """
+        Args:
+            min_interval (float): Minimum number of seconds between two requests.
+        """
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """
+        Blocks until the caller may send its next request. Safe to call from several threads.
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
@@ -1,8 +1,3 @@
-from src.scrappers.job_lab_v2 import (
-    JobLabDriverManager,
-    JobLabScraper,
-    JobLabDataProcessor,
-)
 from src.support_modules.api_menager import APIManager
 from src.support_modules.monitoring_manager import MonitoringManager
 from src.support_modules.performance_optimizer import PerformanceOptimizer
@@ -21,6 +16,13 @@ class UnifiedScraper:
             base_url (str): Base URL for API interactions.
             driver_path (str): Path to the WebDriver executable.
         """
+        # Deferred so that importing this module does not pull in selenium and pandas
+        from src.scrappers.job_lab_v2 import (
+            JobLabDriverManager,
+            JobLabScraper,
+            JobLabDataProcessor,
+        )
+
         self.api_manager = APIManager(base_url)
         self.monitoring_manager = MonitoringManager(self.api_manager)
         self.driver_manager = JobLabDriverManager(
@@ -0,0 +1,142 @@
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+from src.scrappers.crawl_scheduler import CrawlQuery, CrawlScheduler
+
+
+class FakeScraper:
+    """Serves listing pages from memory and fails resumes listed in ``failing``."""
+
+    BASE_URL = 'https://joblab.ru'
+
+    def __init__(self, listings: Dict[str, List[List[str]]], failing: Tuple[str, ...] = ()) -> None:
+        self.listings = listings
+        self.failing = set(failing)
+        self.broken_listings = set()
+        self.listing_requests: List[str] = []
+        self.resume_requests: List[str] = []
+
+    def scrape_listing_page(self, url: str) -> Tuple[List[str], str]:
+        self.listing_requests.append(url)
+        path, _, page = url[len(self.BASE_URL):].partition('?page=')
+        if path in self.broken_listings:
+            raise RuntimeError('driver died')
+        page = int(page or 0)
+        pages = self.listings[path]
+        next_url = f'{self.BASE_URL}{path}?page={page + 1}' if page + 1 < len(pages) else ''
+        return pages[page], next_url
+
+    def scrape_resumes(self, links: List[str]) -> pd.DataFrame:
+        self.resume_requests.extend(links)
+        return pd.DataFrame(
+            {'Resume link': [f'{self.BASE_URL}{link}' for link in links if link not in self.failing]}
+        )
+
+
+class CrawlSchedulerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmp_dir.name)
+        self.state_path = self.tmp_path / 'state.json'
+
+    def tearDown(self) -> None:
+        self._tmp_dir.cleanup()
+
+    def _scheduler(self, scraper: FakeScraper, queries: List[CrawlQuery], **kwargs) -> CrawlScheduler:
+        return CrawlScheduler(scraper=scraper, queries=queries, state_path=str(self.state_path), **kwargs)
+
+    def _state(self) -> dict:
+        return json.loads(self.state_path.read_text(encoding='utf-8'))
+
+    def test_listing_pages_interleaved_by_priority(self) -> None:
+        scraper = FakeScraper({'/a': [['/a1'], ['/a2'], ['/a3']], '/b': [['/b1'], ['/b2'], ['/b3']]})
+        queries = [CrawlQuery('/a', priority=2, max_pages=3), CrawlQuery('/b', priority=1, max_pages=3)]
+        self._scheduler(scraper, queries).run()
+
+        requested = [url[len(scraper.BASE_URL):].split('?')[0] for url in scraper.listing_requests]
+        self.assertEqual(requested, ['/a', '/b', '/a', '/a', '/b', '/b'])
+
+    def test_page_budget_and_shared_links(self) -> None:
+        scraper = FakeScraper({'/a': [['/r1', '/r2'], ['/r3']], '/b': [['/r2', '/r4']]})
+        queries = [CrawlQuery('/a', max_pages=1), CrawlQuery('/b')]
+        scraped = self._scheduler(scraper, queries).run()
+
+        self.assertEqual(scraped, 3)
+        self.assertEqual(sorted(scraper.resume_requests), ['/r1', '/r2', '/r4'])
+
+    def test_recrawl_interval(self) -> None:
+        queries = [CrawlQuery('/a', recrawl_hours=1)]
+        self._scheduler(FakeScraper({'/a': [['/r1']]}), queries).run()
+
+        scraper = FakeScraper({'/a': [['/r1']]})
+        self._scheduler(scraper, queries).run()
+        self.assertEqual(scraper.listing_requests, [])
+        self.assertEqual(scraper.resume_requests, [])
+
+        scraper = FakeScraper({'/a': [['/r1']], '/b': [['/r1', '/r2']]})
+        self._scheduler(scraper, queries + [CrawlQuery('/b', recrawl_hours=1)]).run()
+        self.assertEqual(scraper.listing_requests, [f'{scraper.BASE_URL}/b'])
+        self.assertEqual(scraper.resume_requests, ['/r2'])
+
+    def test_failed_listing_keeps_query_due(self) -> None:
+        scraper = FakeScraper({'/a': [['/r1']], '/b': [['/r2']]})
+        scraper.broken_listings.add('/b')
+        self._scheduler(scraper, [CrawlQuery('/a'), CrawlQuery('/b')]).run()
+        self.assertEqual(list(self._state()['queries']), ['/a'])
+
+        scraper = FakeScraper({'/a': [['/r1']], '/b': [['/r2']]})
+        self._scheduler(scraper, [CrawlQuery('/a'), CrawlQuery('/b')]).run()
+        self.assertEqual(scraper.resume_requests, ['/r2'])
+
+    def test_failed_resumes_retried_then_given_up(self) -> None:
+        queries = [CrawlQuery('/a', recrawl_hours=1)]
+        for attempt in range(1, 3):
+            scraper = FakeScraper({'/a': [['/r1', '/gone']]}, failing=('/gone',))
+            self._scheduler(scraper, queries, max_attempts=3).run()
+            self.assertEqual(self._state()['pending'], {'/gone': {'query': '/a', 'attempts': attempt}})
+
+        scraper = FakeScraper({'/a': [['/r1', '/gone']]}, failing=('/gone',))
+        self._scheduler(scraper, queries, max_attempts=3).run()
+        self.assertEqual(scraper.resume_requests, ['/gone'])
+        self.assertEqual(self._state()['pending'], {})
+
+        scraper = FakeScraper({'/a': [['/r1', '/gone']]})
+        self._scheduler(scraper, queries, max_attempts=3).run()
+        self.assertEqual(scraper.resume_requests, [])
+
+    def test_resume_log_pruned_on_load(self) -> None:
+        resumes_path = self.state_path.with_suffix('.resumes.tsv')
+        now = time.time()
+        resumes_path.write_text(
+            f'/old\t{now - 10 * 3600}\n/r1\t{now - 2 * 3600}\n/r1\t{now - 60}\n/partial', encoding='utf-8'
+        )
+        scheduler = self._scheduler(FakeScraper({'/a': [['/r1', '/r2']]}), [CrawlQuery('/a', recrawl_hours=4)])
+        self.assertEqual(list(scheduler.resumes), ['/r1'])
+        self.assertEqual(resumes_path.read_text(encoding='utf-8'), f'/r1\t{now - 60}\n')
+
+        scheduler.run()
+        logged = [line.split('\t')[0] for line in resumes_path.read_text(encoding='utf-8').splitlines()]
+        self.assertEqual(logged, ['/r1', '/r2'])
+
+    def test_rows_saved_to_run_file(self) -> None:
+        output_path = self.tmp_path / 'resumes.csv'
+        output_path.write_text('old,header\n', encoding='utf-8')
+        scraper = FakeScraper({'/a': [['/gone', '/r1', '/r2', '/r3']]}, failing=('/gone',))
+        self._scheduler(scraper, [CrawlQuery('/a')], output_path=str(output_path), batch_size=2).run()
+
+        self.assertEqual(output_path.read_text(encoding='utf-8'), 'old,header\n')
+        run_files = list(self.tmp_path.glob('resumes-*.csv'))
+        self.assertEqual(len(run_files), 1)
+        data = pd.read_csv(run_files[0], index_col=0)
+        self.assertEqual(list(data.index), [0, 1, 2])
+        self.assertEqual(list(data['Resume link']), [f'{scraper.BASE_URL}/r{number}' for number in (1, 2, 3)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.support_modules.page_archive import PageArchive, SegmentReader
+
+
+class PageArchiveTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.root_dir = Path(self._tmp_dir.name) / 'archive'
+        self.index_path = self.root_dir / PageArchive.INDEX_FILE
+
+    def tearDown(self) -> None:
+        self._tmp_dir.cleanup()
+
+    def _archive(self, **kwargs) -> PageArchive:
+        archive = PageArchive(str(self.root_dir), **kwargs)
+        self.addCleanup(archive.close)
+        return archive
+
+    def test_round_trip(self) -> None:
+        archive = self._archive()
+        archive.append('https://joblab.ru/r/1', '<h1>Повар</h1>', kind='resume')
+        archive.append('https://joblab.ru/resume', '<p>listing</p>', kind='listing')
+        archive.append('https://joblab.ru/r/1', '<h1>Повар-кондитер</h1>', kind='resume')
+
+        reopened = self._archive(read_only=True)
+        self.assertEqual(len(reopened), 2)
+        self.assertEqual(reopened.urls(kind='resume'), ['https://joblab.ru/r/1'])
+        self.assertEqual(reopened.get('https://joblab.ru/r/1'), '<h1>Повар-кондитер</h1>')
+        self.assertEqual(
+            list(reopened.iter_pages(kind='listing')), [('https://joblab.ru/resume', '<p>listing</p>')]
+        )
+
+    def test_segment_rollover(self) -> None:
+        archive = self._archive(segment_max_bytes=200)
+        pages = {f'https://joblab.ru/r/{number}': f'<h1>{number}</h1>' * 20 for number in range(5)}
+        for url, html in pages.items():
+            archive.append(url, html, kind='resume')
+
+        entries = self._archive(read_only=True).entries(kind='resume')
+        self.assertGreater(len({segment for _, (segment, _, _) in entries}), 1)
+        self.assertEqual([url for url, _ in entries], list(pages))
+        reader = SegmentReader(str(self.root_dir))
+        self.addCleanup(reader.close)
+        self.assertEqual({url: reader.read(*entry) for url, entry in entries}, pages)
+
+    def test_reader_remaps_growing_segment(self) -> None:
+        archive = self._archive()
+        archive.append('https://joblab.ru/r/1', 'first', kind='resume')
+        reader = SegmentReader(str(self.root_dir))
+        self.addCleanup(reader.close)
+        self.assertEqual(reader.read(*archive.entries()[0][1]), 'first')
+
+        archive.append('https://joblab.ru/r/2', 'second', kind='resume')
+        self.assertEqual(reader.read(*archive.entries()[1][1]), 'second')
+
+    def test_incomplete_last_line(self) -> None:
+        archive = self._archive()
+        archive.append('https://joblab.ru/r/1', 'first', kind='resume')
+        with open(self.index_path, 'a', encoding='utf-8') as index_file:
+            index_file.write('https://joblab.ru/r/2\tresume\t0\t')
+        size = self.index_path.stat().st_size
+
+        self.assertEqual(self._archive(read_only=True).urls(), ['https://joblab.ru/r/1'])
+        self.assertEqual(self.index_path.stat().st_size, size)
+
+        writable = self._archive()
+        self.assertLess(self.index_path.stat().st_size, size)
+        writable.append('https://joblab.ru/r/3', 'third', kind='resume')
+        reopened = self._archive(read_only=True)
+        self.assertEqual(reopened.urls(), ['https://joblab.ru/r/1', 'https://joblab.ru/r/3'])
+        self.assertEqual(reopened.get('https://joblab.ru/r/3'), 'third')
+
+    def test_malformed_lines_are_skipped(self) -> None:
+        archive = self._archive()
+        archive.append('https://joblab.ru/r/1', 'first', kind='resume')
+        with open(self.index_path, 'a', encoding='utf-8') as index_file:
+            index_file.write('garbage\n')
+            index_file.write('https://joblab.ru/r/2\tresume\t0\tx\t10\n')
+
+        self.assertEqual(self._archive(read_only=True).urls(), ['https://joblab.ru/r/1'])
+
+    def test_read_only(self) -> None:
+        with self.assertRaises(FileNotFoundError):
+            PageArchive(str(self.root_dir), read_only=True)
+        self.assertFalse(self.root_dir.exists())
+
+        self._archive().append('https://joblab.ru/r/1', 'first')
+        with self.assertRaises(PermissionError):
+            self._archive(read_only=True).append('https://joblab.ru/r/2', 'second')
+
+
+if __name__ == '__main__':
+    unittest.main()